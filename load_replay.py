@@ -0,0 +1,261 @@
+"""Synthetic workload generator and replay driver for homework.py."""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field, asdict
+from typing import Optional
+
+from homework import main, read_package
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+WORKLOAD_MESSAGE_RATE = 'Доля {} должна быть в диапазоне [0, 1], получено {}.'
+WORKLOAD_MESSAGE_MIX = 'Неизвестный тип тренировки {} в смеси {}.'
+WORKLOAD_MESSAGE_PACKETS = 'Число пакетов не может быть меньше 0, получено {}.'
+WORKLOAD_MESSAGE_MIX_WEIGHT = 'Вес {} в смеси {} не может быть меньше 0.'
+WORKLOAD_MESSAGE_MIX_EMPTY = 'Сумма весов в смеси {} должна быть больше 0.'
+REPLAY_MESSAGE_RATE = 'Целевая частота должна быть больше 0, получено {}.'
+PARSE_MIX_MESSAGE = 'Неверный формат смеси {}, ожидается SWM=1,RUN=2,WLK=1.'
+
+DEFAULT_MIX = {'SWM': 1.0, 'RUN': 2.0, 'WLK': 1.0}
+PERCENTILES = (50, 90, 99)
+INVALID_KINDS = ('unknown_type', 'missing_field', 'extra_field', 'zero')
+
+
+@dataclass
+class WorkloadConfig:
+    """Settings of the synthetic device fleet."""
+
+    seed: int = 0
+    packets: int = 10000
+    mix: dict = field(default_factory=lambda: dict(DEFAULT_MIX))
+    duplicate_rate: float = 0.0
+    invalid_rate: float = 0.0
+
+    def __post_init__(self):
+        if self.packets < 0:
+            raise ValueError(WORKLOAD_MESSAGE_PACKETS.format(self.packets))
+        for name in ('duplicate_rate', 'invalid_rate'):
+            value = getattr(self, name)
+            if not 0 <= value <= 1:
+                raise ValueError(WORKLOAD_MESSAGE_RATE.format(name, value))
+        for workout_type, weight in self.mix.items():
+            if workout_type not in DEFAULT_MIX:
+                raise ValueError(
+                    WORKLOAD_MESSAGE_MIX.format(workout_type, self.mix)
+                )
+            if weight < 0:
+                raise ValueError(
+                    WORKLOAD_MESSAGE_MIX_WEIGHT.format(workout_type, self.mix)
+                )
+        if sum(self.mix.values()) <= 0:
+            raise ValueError(WORKLOAD_MESSAGE_MIX_EMPTY.format(self.mix))
+
+
+def _clipped_gauss(rng, mu, sigma, low, high):
+    return min(max(rng.gauss(mu, sigma), low), high)
+
+
+def _swimming_packet(rng, duration, weight):
+    length_pool = rng.choice((25, 25, 25, 50))
+    speed = _clipped_gauss(rng, 2.0, 0.5, 0.8, 4.0)
+    count_pool = max(1, round(speed * duration * 1000 / length_pool))
+    strokes = round(count_pool * length_pool / 1.38 * rng.uniform(0.9, 1.1))
+    return [strokes, duration, weight, length_pool, count_pool]
+
+
+def _running_packet(rng, duration, weight):
+    speed = _clipped_gauss(rng, 10.0, 1.5, 6.0, 18.0)
+    return [round(speed * duration * 1000 / 0.65), duration, weight]
+
+
+def _walking_packet(rng, duration, weight):
+    speed = _clipped_gauss(rng, 5.0, 0.7, 3.0, 8.0)
+    height = round(_clipped_gauss(rng, 172, 9, 145, 205), 1)
+    return [round(speed * duration * 1000 / 0.65), duration, weight, height]
+
+
+PACKET_BUILDERS = {
+    'SWM': _swimming_packet,
+    'RUN': _running_packet,
+    'WLK': _walking_packet,
+}
+
+
+def _valid_packet(rng, workout_type):
+    duration = round(_clipped_gauss(rng, 1.0, 0.35, 0.25, 3.0), 3)
+    weight = round(_clipped_gauss(rng, 75, 12, 40, 150), 1)
+    return workout_type, PACKET_BUILDERS[workout_type](rng, duration, weight)
+
+
+def _invalid_packet(rng, workout_type):
+    workout_type, data = _valid_packet(rng, workout_type)
+    kind = rng.choice(INVALID_KINDS)
+    if kind == 'unknown_type':
+        return rng.choice(('CYC', 'swm', '')), data
+    if kind == 'missing_field':
+        return workout_type, data[:-1]
+    if kind == 'extra_field':
+        return workout_type, data + [0]
+    data[1] = 0
+    return workout_type, data
+
+
+def generate_workload(config: WorkloadConfig) -> list:
+    """Build a deterministic list of (workout_type, data) packets."""
+    rng = random.Random(config.seed)
+    types = list(config.mix)
+    weights = [config.mix[workout_type] for workout_type in types]
+    workload = []
+    for _ in range(config.packets):
+        if workload and rng.random() < config.duplicate_rate:
+            workout_type, data = rng.choice(workload[-100:])
+            workload.append((workout_type, list(data)))
+            continue
+        workout_type = rng.choices(types, weights)[0]
+        if rng.random() < config.invalid_rate:
+            workload.append(_invalid_packet(rng, workout_type))
+        else:
+            workload.append(_valid_packet(rng, workout_type))
+    return workload
+
+
+@dataclass
+class ReplayReport:
+    """Machine-readable result of a replay run.
+
+    peak_rss_kb is the process-wide peak, including workload generation.
+    """
+
+    packets: int
+    processed: int
+    errors: dict
+    elapsed_s: float
+    throughput_pps: float
+    latency_ms: dict
+    peak_rss_kb: Optional[int] = None
+    target_rate: Optional[float] = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, indent=2)
+
+
+def _percentile(ordered, percent):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _peak_rss_kb():
+    """Peak resident set size of the whole process in KB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak // 1024
+    return peak
+
+
+def replay(workload: list, rate: Optional[float] = None) -> ReplayReport:
+    """Push the workload through read_package and main.
+
+    Without rate the packets are sent as fast as possible, otherwise
+    they are paced to rate packets per second.
+    """
+    if rate is not None and rate <= 0:
+        raise ValueError(REPLAY_MESSAGE_RATE.format(rate))
+    latencies = []
+    errors = {}
+    with open(os.devnull, 'w') as sink, redirect_stdout(sink):
+        start = time.perf_counter()
+        for index, (workout_type, data) in enumerate(workload):
+            if rate is not None:
+                delay = start + index / rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            sent = time.perf_counter()
+            try:
+                main(read_package(workout_type, data))
+            except (ValueError, TypeError, ZeroDivisionError) as error:
+                name = type(error).__name__
+                errors[name] = errors.get(name, 0) + 1
+            latencies.append(time.perf_counter() - sent)
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    latency_ms = {
+        f'p{percent}': _percentile(latencies, percent) * 1000
+        for percent in PERCENTILES
+    }
+    latency_ms['max'] = latencies[-1] * 1000 if latencies else 0.0
+    return ReplayReport(
+        packets=len(workload),
+        processed=len(workload) - sum(errors.values()),
+        errors=errors,
+        elapsed_s=elapsed,
+        throughput_pps=len(workload) / elapsed if elapsed else 0.0,
+        latency_ms=latency_ms,
+        peak_rss_kb=_peak_rss_kb(),
+        target_rate=rate,
+    )
+
+
+def parse_mix(value: str) -> dict:
+    """Parse a mix like SWM=1,RUN=2,WLK=1."""
+    mix = {}
+    try:
+        for item in value.split(','):
+            workout_type, weight = item.split('=')
+            mix[workout_type.strip()] = float(weight)
+    except ValueError:
+        raise argparse.ArgumentTypeError(PARSE_MIX_MESSAGE.format(value))
+    return mix
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--packets', type=int, default=10000)
+    parser.add_argument('--mix', type=parse_mix, default=dict(DEFAULT_MIX))
+    parser.add_argument('--duplicate-rate', type=float, default=0.0)
+    parser.add_argument('--invalid-rate', type=float, default=0.0)
+    parser.add_argument(
+        '--rate', type=float, default=None,
+        help='packets per second; as fast as possible if omitted'
+    )
+    parser.add_argument('--output', default=None, help='report file path')
+    return parser
+
+
+def run(argv=None) -> ReplayReport:
+    """Generate the workload, replay it and write the report."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        config = WorkloadConfig(
+            seed=args.seed, packets=args.packets, mix=args.mix,
+            duplicate_rate=args.duplicate_rate,
+            invalid_rate=args.invalid_rate
+        )
+        report = replay(generate_workload(config), args.rate)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.output is None:
+        print(report.to_json())
+    else:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            output.write(report.to_json())
+    return report
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+import load_replay
+
+
+def test_generate_workload_is_deterministic():
+    config = load_replay.WorkloadConfig(
+        seed=42, packets=500, duplicate_rate=0.1, invalid_rate=0.1
+    )
+    assert (
+        load_replay.generate_workload(config)
+        == load_replay.generate_workload(config)
+    )
+
+
+def test_generate_workload_respects_mix():
+    config = load_replay.WorkloadConfig(
+        seed=1, packets=300, mix={'RUN': 1}
+    )
+    workload = load_replay.generate_workload(config)
+    assert len(workload) == 300
+    assert {workout_type for workout_type, _ in workload} == {'RUN'}
+
+
+def test_generate_workload_duplicates():
+    config = load_replay.WorkloadConfig(
+        seed=5, packets=500, duplicate_rate=0.3
+    )
+    workload = load_replay.generate_workload(config)
+    unique = {(workout_type, tuple(data)) for workout_type, data in workload}
+    assert len(unique) < len(workload)
+
+
+def test_generate_workload_full_duplicate_rate_repeats_first_packet():
+    config = load_replay.WorkloadConfig(
+        seed=5, packets=50, duplicate_rate=1
+    )
+    workload = load_replay.generate_workload(config)
+    assert all(packet == workload[0] for packet in workload)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'duplicate_rate': 1.5},
+    {'invalid_rate': -0.1},
+    {'mix': {'CYC': 1}},
+    {'mix': {'RUN': 0}},
+    {'mix': {'RUN': -1, 'SWM': 2}},
+    {'packets': -5},
+])
+def test_workload_config_validation(kwargs):
+    with pytest.raises(ValueError):
+        load_replay.WorkloadConfig(**kwargs)
+
+
+def test_replay_valid_workload():
+    config = load_replay.WorkloadConfig(seed=7, packets=200)
+    report = load_replay.replay(load_replay.generate_workload(config))
+    assert report.packets == 200
+    assert report.processed == 200
+    assert report.errors == {}
+    assert report.latency_ms['p50'] <= report.latency_ms['p99']
+    assert report.latency_ms['p99'] <= report.latency_ms['max']
+
+
+def test_replay_counts_invalid_packets():
+    config = load_replay.WorkloadConfig(seed=3, packets=200, invalid_rate=1)
+    report = load_replay.replay(load_replay.generate_workload(config))
+    assert report.processed == 0
+    assert sum(report.errors.values()) == 200
+
+
+def test_replay_is_paced_to_rate():
+    rate = 1000
+    config = load_replay.WorkloadConfig(seed=9, packets=100)
+    report = load_replay.replay(
+        load_replay.generate_workload(config), rate=rate
+    )
+    assert report.elapsed_s >= 0.099
+    assert report.throughput_pps <= rate * 1.05
+
+
+def test_replay_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        load_replay.replay([], rate=0)
+
+
+def test_run_writes_report(tmp_path):
+    output = tmp_path / 'report.json'
+    load_replay.run([
+        '--packets', '50', '--mix', 'SWM=1,WLK=1',
+        '--rate', '5000', '--output', str(output)
+    ])
+    report = json.loads(output.read_text(encoding='utf-8'))
+    assert report['packets'] == 50
+    assert report['target_rate'] == 5000
+    assert set(report['latency_ms']) == {'p50', 'p90', 'p99', 'max'}
+
+
+@pytest.mark.parametrize('argv', [
+    ['--mix', 'CYC=1'],
+    ['--duplicate-rate', '2'],
+    ['--rate', '0'],
+    ['--packets', '-5'],
+])
+def test_run_rejects_invalid_arguments(argv, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        load_replay.run(argv)
+    assert exc_info.value.code == 2
+    assert 'error:' in capsys.readouterr().err